@@ -4,44 +4,354 @@ __author__ = ["TonyBagnall"]
 
 from sklearn.ensemble import RandomForestClassifier
 
-from sktime.classification.dictionary_based import (
-    MUSE,
-    WEASEL,
-    BOSSEnsemble,
-    ContractableBOSS,
-    TemporalDictionaryEnsemble,
-)
-from sktime.classification.distance_based import (
-    ElasticEnsemble,
-    KNeighborsTimeSeriesClassifier,
-    ProximityForest,
-    ProximityStump,
-    ProximityTree,
-    ShapeDTW,
-)
-from sktime.classification.feature_based import (
-    Catch22Classifier,
-    FreshPRINCE,
-    MatrixProfileClassifier,
-    RandomIntervalClassifier,
-    SignatureClassifier,
-    SummaryClassifier,
-    TSFreshClassifier,
-)
-from sktime.classification.hybrid import HIVECOTEV1, HIVECOTEV2
-from sktime.classification.interval_based import (
-    CanonicalIntervalForest,
-    DrCIF,
-    RandomIntervalSpectralEnsemble,
-    SupervisedTimeSeriesForest,
-    TimeSeriesForestClassifier,
-)
-from sktime.classification.kernel_based import Arsenal, RocketClassifier
-from sktime.classification.shapelet_based import ShapeletTransformClassifier
-from sktime.transformations.series.summarize import SummaryTransformer
-
-
-def set_classifier(cls, resample_id=None, train_file=False):
+_CLASSIFIER_FACTORIES = {}
+
+
+def _register(*names):
+    """Register a classifier factory under one or more (lower case) names."""
+
+    def _decorator(factory):
+        for name in names:
+            _CLASSIFIER_FACTORIES[name] = factory
+        return factory
+
+    return _decorator
+
+
+# Dictionary based
+@_register("boss", "bossensemble")
+def _boss(resample_id, train_file, n_jobs):
+    from sktime.classification.dictionary_based import BOSSEnsemble
+
+    return BOSSEnsemble(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("cboss", "contractableboss")
+def _cboss(resample_id, train_file, n_jobs):
+    from sktime.classification.dictionary_based import ContractableBOSS
+
+    return ContractableBOSS(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("tde", "temporaldictionaryensemble")
+def _tde(resample_id, train_file, n_jobs):
+    from sktime.classification.dictionary_based import TemporalDictionaryEnsemble
+
+    return TemporalDictionaryEnsemble(
+        random_state=resample_id, n_jobs=n_jobs, save_train_predictions=train_file
+    )
+
+
+@_register("weasel")
+def _weasel(resample_id, train_file, n_jobs):
+    from sktime.classification.dictionary_based import WEASEL
+
+    return WEASEL(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("muse")
+def _muse(resample_id, train_file, n_jobs):
+    from sktime.classification.dictionary_based import MUSE
+
+    return MUSE(random_state=resample_id, n_jobs=n_jobs)
+
+
+# Distance based
+@_register("pf", "proximityforest")
+def _pf(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import ProximityForest
+
+    return ProximityForest(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("pt", "proximitytree")
+def _pt(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import ProximityTree
+
+    return ProximityTree(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("ps", "proximitystump")
+def _ps(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import ProximityStump
+
+    return ProximityStump(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("dtwcv", "kneighborstimeseriesclassifier")
+def _dtwcv(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import KNeighborsTimeSeriesClassifier
+
+    return KNeighborsTimeSeriesClassifier(distance="dtwcv", n_jobs=n_jobs)
+
+
+@_register("dtw", "1nn-dtw")
+def _dtw(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import KNeighborsTimeSeriesClassifier
+
+    # 10% Sakoe-Chiba band, only cells within the window are evaluated
+    return KNeighborsTimeSeriesClassifier(
+        distance="dtw", distance_params={"window": 0.1}, n_jobs=n_jobs
+    )
+
+
+@_register("msm", "1nn-msm")
+def _msm(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import KNeighborsTimeSeriesClassifier
+
+    return KNeighborsTimeSeriesClassifier(distance="msm", n_jobs=n_jobs)
+
+
+@_register("ee", "elasticensemble")
+def _ee(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import ElasticEnsemble
+
+    return ElasticEnsemble(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("shapedtw")
+def _shapedtw(resample_id, train_file, n_jobs):
+    from sktime.classification.distance_based import ShapeDTW
+
+    return ShapeDTW()
+
+
+# Feature based
+@_register("summary")
+def _summary(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import SummaryClassifier
+
+    return SummaryClassifier(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        estimator=RandomForestClassifier(n_estimators=500),
+    )
+
+
+@_register("summary-intervals")
+def _summary_intervals(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import RandomIntervalClassifier
+    from sktime.transformations.series.summarize import SummaryTransformer
+
+    return RandomIntervalClassifier(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        interval_transformers=SummaryTransformer(
+            summary_function=("mean", "std", "min", "max"),
+            quantiles=(0.25, 0.5, 0.75),
+        ),
+        estimator=RandomForestClassifier(n_estimators=500),
+    )
+
+
+@_register("summary-catch22")
+def _summary_catch22(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import RandomIntervalClassifier
+
+    return RandomIntervalClassifier(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        estimator=RandomForestClassifier(n_estimators=500),
+    )
+
+
+@_register("catch22")
+def _catch22(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import Catch22Classifier
+
+    return Catch22Classifier(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        estimator=RandomForestClassifier(n_estimators=500),
+    )
+
+
+@_register("matrixprofile")
+def _matrixprofile(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import MatrixProfileClassifier
+
+    return MatrixProfileClassifier(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("signature")
+def _signature(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import SignatureClassifier
+
+    return SignatureClassifier(
+        random_state=resample_id,
+        estimator=RandomForestClassifier(n_estimators=500, n_jobs=n_jobs),
+    )
+
+
+@_register("tsfresh")
+def _tsfresh(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import TSFreshClassifier
+
+    return TSFreshClassifier(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        estimator=RandomForestClassifier(n_estimators=500),
+    )
+
+
+@_register("tsfresh-r")
+def _tsfresh_r(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import TSFreshClassifier
+
+    return TSFreshClassifier(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        estimator=RandomForestClassifier(n_estimators=500),
+        relevant_feature_extractor=True,
+    )
+
+
+@_register("freshprince")
+def _freshprince(resample_id, train_file, n_jobs):
+    from sktime.classification.feature_based import FreshPRINCE
+
+    return FreshPRINCE(
+        random_state=resample_id, n_jobs=n_jobs, save_transformed_data=train_file
+    )
+
+
+# Hybrid
+@_register("hc1", "hivecotev1")
+def _hc1(resample_id, train_file, n_jobs):
+    from sktime.classification.hybrid import HIVECOTEV1
+
+    return HIVECOTEV1(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("hc2", "hivecotev2")
+def _hc2(resample_id, train_file, n_jobs):
+    from sktime.classification.hybrid import HIVECOTEV2
+
+    return HIVECOTEV2(random_state=resample_id, n_jobs=n_jobs)
+
+
+# Interval based
+@_register("rise", "randomintervalspectralforest")
+def _rise(resample_id, train_file, n_jobs):
+    from sktime.classification.interval_based import RandomIntervalSpectralEnsemble
+
+    return RandomIntervalSpectralEnsemble(
+        random_state=resample_id, n_jobs=n_jobs, n_estimators=500
+    )
+
+
+@_register("tsf", "timeseriesforestclassifier")
+def _tsf(resample_id, train_file, n_jobs):
+    from sktime.classification.interval_based import TimeSeriesForestClassifier
+
+    return TimeSeriesForestClassifier(
+        random_state=resample_id, n_jobs=n_jobs, n_estimators=500
+    )
+
+
+@_register("cif", "canonicalintervalforest")
+def _cif(resample_id, train_file, n_jobs):
+    from sktime.classification.interval_based import CanonicalIntervalForest
+
+    return CanonicalIntervalForest(
+        random_state=resample_id, n_jobs=n_jobs, n_estimators=500
+    )
+
+
+@_register("stsf", "supervisedtimeseriesforest")
+def _stsf(resample_id, train_file, n_jobs):
+    from sktime.classification.interval_based import SupervisedTimeSeriesForest
+
+    return SupervisedTimeSeriesForest(
+        random_state=resample_id, n_jobs=n_jobs, n_estimators=500
+    )
+
+
+@_register("drcif")
+def _drcif(resample_id, train_file, n_jobs):
+    from sktime.classification.interval_based import DrCIF
+
+    return DrCIF(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        n_estimators=500,
+        save_transformed_data=train_file,
+    )
+
+
+# Kernel based
+@_register("rocket")
+def _rocket(resample_id, train_file, n_jobs):
+    from sktime.classification.kernel_based import RocketClassifier
+
+    return RocketClassifier(random_state=resample_id, n_jobs=n_jobs)
+
+
+@_register("mini-rocket")
+def _mini_rocket(resample_id, train_file, n_jobs):
+    from sktime.classification.kernel_based import RocketClassifier
+
+    return RocketClassifier(
+        random_state=resample_id, n_jobs=n_jobs, rocket_transform="minirocket"
+    )
+
+
+@_register("multi-rocket")
+def _multi_rocket(resample_id, train_file, n_jobs):
+    from sktime.classification.kernel_based import RocketClassifier
+
+    return RocketClassifier(
+        random_state=resample_id, n_jobs=n_jobs, rocket_transform="multirocket"
+    )
+
+
+@_register("arsenal")
+def _arsenal(resample_id, train_file, n_jobs):
+    from sktime.classification.kernel_based import Arsenal
+
+    return Arsenal(
+        random_state=resample_id, n_jobs=n_jobs, save_transformed_data=train_file
+    )
+
+
+@_register("mini-arsenal")
+def _mini_arsenal(resample_id, train_file, n_jobs):
+    from sktime.classification.kernel_based import Arsenal
+
+    return Arsenal(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        save_transformed_data=train_file,
+        rocket_transform="minirocket",
+    )
+
+
+@_register("multi-arsenal")
+def _multi_arsenal(resample_id, train_file, n_jobs):
+    from sktime.classification.kernel_based import Arsenal
+
+    return Arsenal(
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        save_transformed_data=train_file,
+        rocket_transform="multirocket",
+    )
+
+
+# Shapelet based
+@_register("stc", "shapelettransformclassifier")
+def _stc(resample_id, train_file, n_jobs):
+    from sktime.classification.shapelet_based import ShapeletTransformClassifier
+
+    return ShapeletTransformClassifier(
+        transform_limit_in_minutes=120,
+        random_state=resample_id,
+        n_jobs=n_jobs,
+        save_transformed_data=train_file,
+    )
+
+
+def set_classifier(cls, resample_id=None, train_file=False, n_jobs=1):
     """Construct a classifier, possibly seeded.
 
     Basic way of creating the classifier to build using the default settings. This
@@ -57,133 +367,16 @@ def set_classifier(cls, resample_id=None, train_file=False):
         Classifier random seed.
     train_file : bool, default=False
         Whether a train file is being produced.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel for both `fit` and `predict`, passed
+        to classifiers that support it. ``-1`` means using all processors.
 
     Return
     ------
     classifier : A BaseClassifier.
         The classifier matching the input classifier name.
     """
-    name = cls.lower()
-    # Dictionary based
-    if name == "boss" or name == "bossensemble":
-        return BOSSEnsemble(random_state=resample_id)
-    elif name == "cboss" or name == "contractableboss":
-        return ContractableBOSS(random_state=resample_id)
-    elif name == "tde" or name == "temporaldictionaryensemble":
-        return TemporalDictionaryEnsemble(
-            random_state=resample_id, save_train_predictions=train_file
-        )
-    elif name == "weasel":
-        return WEASEL(random_state=resample_id)
-    elif name == "muse":
-        return MUSE(random_state=resample_id)
-    # Distance based
-    elif name == "pf" or name == "proximityforest":
-        return ProximityForest(random_state=resample_id)
-    elif name == "pt" or name == "proximitytree":
-        return ProximityTree(random_state=resample_id)
-    elif name == "ps" or name == "proximityStump":
-        return ProximityStump(random_state=resample_id)
-    elif name == "dtwcv" or name == "kneighborstimeseriesclassifier":
-        return KNeighborsTimeSeriesClassifier(distance="dtwcv")
-    elif name == "dtw" or name == "1nn-dtw":
-        return KNeighborsTimeSeriesClassifier(distance="dtw")
-    elif name == "msm" or name == "1nn-msm":
-        return KNeighborsTimeSeriesClassifier(distance="msm")
-    elif name == "ee" or name == "elasticensemble":
-        return ElasticEnsemble(random_state=resample_id)
-    elif name == "shapedtw":
-        return ShapeDTW()
-    # Feature based
-    elif name == "summary":
-        return SummaryClassifier(
-            random_state=resample_id, estimator=RandomForestClassifier(n_estimators=500)
-        )
-    elif name == "summary-intervals":
-        return RandomIntervalClassifier(
-            random_state=resample_id,
-            interval_transformers=SummaryTransformer(
-                summary_function=("mean", "std", "min", "max"),
-                quantiles=(0.25, 0.5, 0.75),
-            ),
-            estimator=RandomForestClassifier(n_estimators=500),
-        )
-    elif name == "summary-catch22":
-        return RandomIntervalClassifier(
-            random_state=resample_id, estimator=RandomForestClassifier(n_estimators=500)
-        )
-    elif name == "catch22":
-        return Catch22Classifier(
-            random_state=resample_id, estimator=RandomForestClassifier(n_estimators=500)
-        )
-    elif name == "matrixprofile":
-        return MatrixProfileClassifier(random_state=resample_id)
-    elif name == "signature":
-        return SignatureClassifier(
-            random_state=resample_id,
-            estimator=RandomForestClassifier(n_estimators=500),
-        )
-    elif name == "tsfresh":
-        return TSFreshClassifier(
-            random_state=resample_id, estimator=RandomForestClassifier(n_estimators=500)
-        )
-    elif name == "tsfresh-r":
-        return TSFreshClassifier(
-            random_state=resample_id,
-            estimator=RandomForestClassifier(n_estimators=500),
-            relevant_feature_extractor=True,
-        )
-    elif name == "freshprince":
-        return FreshPRINCE(random_state=resample_id, save_transformed_data=train_file)
-    # Hybrid
-    elif name == "hc1" or name == "hivecotev1":
-        return HIVECOTEV1(random_state=resample_id)
-    elif name == "hc2" or name == "hivecotev2":
-        return HIVECOTEV2(random_state=resample_id)
-    # Interval based
-    elif name == "rise" or name == "randomintervalspectralforest":
-        return RandomIntervalSpectralEnsemble(
-            random_state=resample_id, n_estimators=500
-        )
-    elif name == "tsf" or name == "timeseriesforestclassifier":
-        return TimeSeriesForestClassifier(random_state=resample_id, n_estimators=500)
-    elif name == "cif" or name == "canonicalintervalforest":
-        return CanonicalIntervalForest(random_state=resample_id, n_estimators=500)
-    elif name == "stsf" or name == "supervisedtimeseriesforest":
-        return SupervisedTimeSeriesForest(random_state=resample_id, n_estimators=500)
-    elif name == "drcif":
-        return DrCIF(
-            random_state=resample_id, n_estimators=500, save_transformed_data=train_file
-        )
-    # Kernel based
-    elif name == "rocket":
-        return RocketClassifier(random_state=resample_id)
-    elif name == "mini-rocket":
-        return RocketClassifier(random_state=resample_id, rocket_transform="minirocket")
-    elif name == "multi-rocket":
-        return RocketClassifier(
-            random_state=resample_id, rocket_transform="multirocket"
-        )
-    elif name == "arsenal":
-        return Arsenal(random_state=resample_id, save_transformed_data=train_file)
-    elif name == "mini-arsenal":
-        return Arsenal(
-            random_state=resample_id,
-            save_transformed_data=train_file,
-            rocket_transform="minirocket",
-        )
-    elif name == "multi-arsenal":
-        return Arsenal(
-            random_state=resample_id,
-            save_transformed_data=train_file,
-            rocket_transform="multirocket",
-        )
-    # Shapelet based
-    elif name == "stc" or name == "shapelettransformclassifier":
-        return ShapeletTransformClassifier(
-            transform_limit_in_minutes=120,
-            random_state=resample_id,
-            save_transformed_data=train_file,
-        )
-    else:
+    factory = _CLASSIFIER_FACTORIES.get(cls.lower())
+    if factory is None:
         raise Exception("UNKNOWN CLASSIFIER")
+    return factory(resample_id, train_file, n_jobs)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Test set_classifier."""
+
+__author__ = ["TonyBagnall"]
+
+import pytest
+
+from sktime.contrib.set_classifier import set_classifier
+
+
+def test_set_classifier_returns_new_instance():
+    """Test that every call to set_classifier constructs a new classifier."""
+    clf1 = set_classifier("rocket", resample_id=0, n_jobs=2)
+    clf2 = set_classifier("ROCKET", resample_id=0, n_jobs=2)
+
+    assert clf1 is not clf2
+    assert clf1.get_params() == clf2.get_params()
+    assert clf1.random_state == 0
+    assert clf1.n_jobs == 2
+
+
+def test_set_classifier_unknown():
+    """Test that an unknown classifier name raises an error."""
+    with pytest.raises(Exception, match="UNKNOWN CLASSIFIER"):
+        set_classifier("not-a-classifier")
@@ -7,11 +7,17 @@ convert_Series_to_Panel(obj, store=None)
     converts obj of Series mtype to "adjacent" Panel mtype (e.g., numpy to numpy)
 convert_Panel_to_Series(obj, store=None)
     converts obj of Panel mtype to "adjacent" Series mtype (e.g., numpy to numpy)
+convert_Series_batch_to_Panel(objs, store=None)
+    converts list of objs of Series mtype to a multi-series Panel
 """
 
 __author__ = ["fkiraly"]
 
-__all__ = ["convert_Series_to_Panel", "convert_Panel_to_Series"]
+__all__ = [
+    "convert_Series_to_Panel",
+    "convert_Panel_to_Series",
+    "convert_Series_batch_to_Panel",
+]
 
 import numpy as np
 import pandas as pd
@@ -39,24 +45,76 @@ def convert_Series_to_Panel(obj, store=None):
     if obj was pd.Series or pd.DataFrame, returns a panel of mtype df-list
         this is done by possibly converting to pd.DataFrame, and adding a list nesting
     if obj was np.ndarray, returns a panel of mtype numpy3D, by adding one axis at end
+        i.e., an array of shape (n, d) results in shape (n, d, 1), time points are
+        in the first axis. This differs from convert_Series_batch_to_Panel,
+        which returns shape (1, d, n) for [obj], with time points in the last axis
     """
     if isinstance(obj, pd.Series):
-        obj = pd.DataFrame(obj)
+        obj = obj.to_frame()
 
     if isinstance(obj, pd.DataFrame):
         return [obj]
 
+    # reshape only adds axes of length 1, so the result is always a view on obj
     if isinstance(obj, np.ndarray):
-        if len(obj.shape) == 2:
-            obj = np.expand_dims(obj, 2)
-        elif len(obj.shape) == 1:
-            obj = np.expand_dims(obj, (1, 2))
+        if obj.ndim == 2:
+            obj = obj.reshape(obj.shape[0], obj.shape[1], 1)
+        elif obj.ndim == 1:
+            obj = obj.reshape(obj.shape[0], 1, 1)
         else:
             raise ValueError("if obj is np.ndarray, must be of dim 1 or 2")
 
     return obj
 
 
+def convert_Series_batch_to_Panel(objs, store=None):
+    """Convert a list of series to a multi-series panel, in one step.
+
+    For a list of np.ndarray of equal shape, this results in a numpy3D panel,
+        obtained by a single np.stack, instead of one conversion per series.
+    Otherwise, this results in a list of pd.DataFrame (df-list).
+
+    Assumes elements of objs are conformant with one of the three Series mtypes.
+    This method does not perform full mtype checks, use mtype or check_is_mtype for
+    checks.
+
+    Parameters
+    ----------
+    objs: list of objects of scitype Series, of mtype pd.DataFrame, pd.Series,
+        or np.ndarray
+
+    Returns
+    -------
+    if objs are np.ndarray of same shape, returns a panel of mtype numpy3D
+        i-th instance is objs[i], with axes (instance, variable, time point)
+        note: for a single np.ndarray obj of shape (n, d), this is not the same as
+        convert_Series_to_Panel(obj), which adds an axis at the end and returns
+        shape (n, d, 1), while this function returns shape (1, d, n) for [obj]
+    otherwise, returns a panel of mtype df-list
+        i-th element of the list is objs[i], converted to pd.DataFrame
+    """
+    if not isinstance(objs, list):
+        raise TypeError("objs must be a list of Series")
+
+    if len(objs) > 0 and all(isinstance(obj, np.ndarray) for obj in objs):
+        if any(obj.ndim not in [1, 2] for obj in objs):
+            raise ValueError("if obj is np.ndarray, must be of dim 1 or 2")
+        # Series np.ndarray have time points in rows, numpy3D in the last axis
+        arrs = [obj.reshape(obj.shape[0], -1).T for obj in objs]
+        if len({arr.shape for arr in arrs}) == 1:
+            return np.stack(arrs, axis=0)
+
+    # unequal shapes or pandas input, cannot be numpy3D, so we return df-list
+    panel = []
+    for obj in objs:
+        if isinstance(obj, pd.Series):
+            obj = obj.to_frame()
+        elif isinstance(obj, np.ndarray):
+            obj = pd.DataFrame(obj)
+        panel.append(obj)
+    return panel
+
+
 def convert_Panel_to_Series(obj, store=None):
     """Convert single-series panel to a series.
 
@@ -82,12 +140,14 @@ def convert_Panel_to_Series(obj, store=None):
             raise ValueError("obj must be of length 1")
 
     if isinstance(obj, pd.DataFrame):
+        # shallow copy, so that the index of the input obj is not modified
+        obj = obj.copy(deep=False)
         obj.index = obj.index.droplevel(level=0)
 
     if isinstance(obj, np.ndarray):
         if obj.ndim != 3 or obj.shape[0] != 1:
             raise ValueError("if obj is np.ndarray, must be of dim 3, with shape[0]=1")
-        obj = np.reshape(obj, (obj.shape[1], obj.shape[2]))
+        obj = obj[0]
 
     return obj
 
@@ -109,12 +169,18 @@ def convert_Series_to_Hierarchical(obj, store=None):
     -------
     returns a data container of mtype pd_multiindex_hier
     """
-    obj_df = convert_to(obj, to_type="pd.DataFrame", as_scitype="Series")
-    obj_df = obj_df.copy()
-    obj_df["__level1"] = 0
-    obj_df["__level2"] = 0
-    obj_df = obj_df.set_index(["__level1", "__level2"], append=True)
-    obj_df = obj_df.reorder_levels([1, 2, 0])
+    # skip mtype inference in convert_to if obj already is a pd.DataFrame Series
+    if isinstance(obj, pd.DataFrame) and obj.index.nlevels == 1:
+        obj_df = obj
+    else:
+        obj_df = convert_to(obj, to_type="pd.DataFrame", as_scitype="Series")
+    # shallow copy shares the data with obj_df, only the index is replaced
+    obj_df = obj_df.copy(deep=False)
+    zeros = np.zeros(len(obj_df), dtype=np.int64)
+    obj_df.index = pd.MultiIndex.from_arrays(
+        [zeros, zeros, obj_df.index],
+        names=["__level1", "__level2", obj_df.index.name],
+    )
     return obj_df
 
 
@@ -136,7 +202,7 @@ def convert_Hierarchical_to_Series(obj, store=None):
     returns a data container of mtype pd.DataFrame, of scitype Series
     """
     obj_df = convert_to(obj, to_type="pd_multiindex_hier", as_scitype="Hierarchical")
-    obj_df = obj_df.copy()
+    obj_df = obj_df.copy(deep=False)
     obj_df.index = obj_df.index.get_level_values(-1)
     return obj_df
 
@@ -158,18 +224,29 @@ def convert_Panel_to_Hierarchical(obj, store=None):
     -------
     returns a data container of mtype pd_multiindex_hier
     """
-    obj_df = convert_to(obj, to_type="pd-multiindex", as_scitype="Panel")
-    obj_df = obj_df.copy()
-    obj_df["__level2"] = 0
-    obj_df = obj_df.set_index(["__level2"], append=True)
-    obj_df = obj_df.reorder_levels([2, 0, 1])
+    # skip mtype inference in convert_to if obj already is a pd-multiindex Panel
+    if isinstance(obj, pd.DataFrame) and obj.index.nlevels == 2:
+        obj_df = obj
+    else:
+        obj_df = convert_to(obj, to_type="pd-multiindex", as_scitype="Panel")
+    obj_df = obj_df.copy(deep=False)
+    index = obj_df.index
+    obj_df.index = pd.MultiIndex.from_arrays(
+        [
+            np.zeros(len(obj_df), dtype=np.int64),
+            index.get_level_values(0),
+            index.get_level_values(1),
+        ],
+        names=["__level2"] + list(index.names),
+    )
     return obj_df
 
 
 def convert_Hierarchical_to_Panel(obj, store=None):
-    """Convert single-series hierarchical object to a series.
+    """Convert single-panel hierarchical object to a panel.
 
-    Removes one dimensions to obtain a panel, by removing 1 level from MultiIndex.
+    Removes dimensions to obtain a panel, by removing all but the last 2 levels
+    from the MultiIndex. Only the index is replaced, data is not copied.
 
     Assumes input is conformant with Hierarchical mtype.
     This method does not perform full mtype checks, use mtype or check_is_mtype for
@@ -183,12 +260,29 @@ def convert_Hierarchical_to_Panel(obj, store=None):
     -------
     returns a data container of mtype pd-multiindex, of scitype Panel
     """
-    obj_df = convert_to(obj, to_type="pd_multiindex_hier", as_scitype="Hierarchical")
-    obj_df = obj_df.copy()
-    obj_df.index = obj_df.index.get_level_values([-2, -1])
+    # skip mtype inference in convert_to if obj already is a pd_multiindex_hier
+    if isinstance(obj, pd.DataFrame) and obj.index.nlevels >= 3:
+        obj_df = obj
+    else:
+        obj_df = convert_to(
+            obj, to_type="pd_multiindex_hier", as_scitype="Hierarchical"
+        )
+    obj_df = obj_df.copy(deep=False)
+    # keep only the last two levels, i.e., instance and time index
+    obj_df.index = obj_df.index.droplevel(list(range(obj_df.index.nlevels - 2)))
     return obj_df
 
 
+_CONVERTERS = {
+    ("Series", "Panel"): convert_Series_to_Panel,
+    ("Panel", "Series"): convert_Panel_to_Series,
+    ("Series", "Hierarchical"): convert_Series_to_Hierarchical,
+    ("Hierarchical", "Series"): convert_Hierarchical_to_Series,
+    ("Panel", "Hierarchical"): convert_Panel_to_Hierarchical,
+    ("Hierarchical", "Panel"): convert_Hierarchical_to_Panel,
+}
+
+
 def convert_to_scitype(obj, to_scitype, from_scitype=None, store=None):
     """Convert single-series or single-panel between mtypes.
 
@@ -222,7 +316,6 @@ def convert_to_scitype(obj, to_scitype, from_scitype=None, store=None):
     if to_scitype == from_scitype:
         return obj
 
-    func_name = f"convert_{from_scitype}_to_{to_scitype}"
-    func = eval(func_name)
+    func = _CONVERTERS[(from_scitype, to_scitype)]
 
     return func(obj, store=store)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Testing conversions between Series, Panel and Hierarchical scitypes."""
+
+__author__ = ["fkiraly"]
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.datatypes import check_is_mtype
+from sktime.datatypes._examples import get_examples
+from sktime.datatypes._series_as_panel import (
+    convert_Panel_to_Series,
+    convert_Series_batch_to_Panel,
+    convert_Series_to_Panel,
+    convert_to_scitype,
+)
+from sktime.utils._testing.deep_equals import deep_equals
+
+# pairs of scitype and the pandas based mtype used by the hierarchical converters
+SCITYPE_MTYPES = [
+    ("Series", "pd.DataFrame"),
+    ("Panel", "pd-multiindex"),
+]
+
+
+@pytest.mark.parametrize("scitype, mtype", SCITYPE_MTYPES)
+def test_convert_to_hierarchical_and_back(scitype, mtype):
+    """Test that conversion to Hierarchical and back recovers the input.
+
+    Also tests that the input object is not modified by either conversion.
+    """
+    fixtures = get_examples(mtype=mtype, as_scitype=scitype)
+
+    for fixture in fixtures.values():
+        if fixture is None:
+            continue
+        fixture_orig = fixture.copy()
+
+        hier = convert_to_scitype(fixture, "Hierarchical", from_scitype=scitype)
+        assert check_is_mtype(hier, "pd_multiindex_hier", scitype="Hierarchical")
+        assert deep_equals(fixture, fixture_orig)
+
+        hier_orig = hier.copy()
+        back = convert_to_scitype(hier, scitype, from_scitype="Hierarchical")
+        assert check_is_mtype(back, mtype, scitype=scitype)
+        assert deep_equals(back, fixture)
+        assert deep_equals(hier, hier_orig)
+
+
+def test_convert_hierarchical_to_panel_deep_hierarchy():
+    """Test that conversion to Panel keeps the last two levels of a deep hierarchy."""
+    index = pd.MultiIndex.from_product(
+        [["a", "b"], ["c", "d"], [0, 1], [0, 1, 2]],
+        names=["foo", "bar", "instance", "time"],
+    )
+    hier = pd.DataFrame({"var": np.arange(24.0)}, index=index)
+    hier_orig = hier.copy()
+
+    panel = convert_to_scitype(hier, "Panel", from_scitype="Hierarchical")
+
+    assert panel.index.names == ["instance", "time"]
+    np.testing.assert_array_equal(panel.values, hier.values)
+    assert deep_equals(hier, hier_orig)
+
+
+def test_convert_series_to_panel_and_back():
+    """Test that conversion of Series to Panel and back recovers the input."""
+    fixtures = get_examples(mtype="pd.DataFrame", as_scitype="Series")
+
+    for fixture in fixtures.values():
+        if fixture is None:
+            continue
+
+        panel = convert_Series_to_Panel(fixture)
+        back = convert_Panel_to_Series(panel)
+        assert deep_equals(back, fixture)
+
+
+def test_convert_panel_to_series_does_not_modify_input():
+    """Test that convert_Panel_to_Series leaves a pd-multiindex input unchanged."""
+    index = pd.MultiIndex.from_product([[0], [0, 1, 2]], names=["instance", "time"])
+    panel = pd.DataFrame({"a": [1.0, 2.0, 3.0]}, index=index)
+    panel_orig = panel.copy()
+
+    series = convert_Panel_to_Series(panel)
+
+    assert check_is_mtype(series, "pd.DataFrame", scitype="Series")
+    assert deep_equals(panel, panel_orig)
+
+
+def test_convert_series_batch_to_panel():
+    """Test conversion of a list of Series to numpy3D or df-list Panel."""
+    arrs = [np.random.random(size=(10, 2)) for _ in range(3)]
+
+    panel = convert_Series_batch_to_Panel(arrs)
+    assert check_is_mtype(panel, "numpy3D", scitype="Panel")
+    assert panel.shape == (3, 2, 10)
+    for i, arr in enumerate(arrs):
+        np.testing.assert_array_equal(panel[i], arr.T)
+
+    panel = convert_Series_batch_to_Panel([np.arange(10.0), np.arange(10.0)])
+    assert panel.shape == (2, 1, 10)
+
+    # series of unequal length cannot be numpy3D, the result is df-list
+    arrs_unequal = [np.random.random(size=(10, 2)), np.random.random(size=(5, 2))]
+    panel = convert_Series_batch_to_Panel(arrs_unequal)
+    assert check_is_mtype(panel, "df-list", scitype="Panel")
+    np.testing.assert_array_equal(panel[1].values, arrs_unequal[1])
+
+    series = [pd.Series(np.arange(5.0)), pd.DataFrame({"a": np.arange(5.0)})]
+    panel = convert_Series_batch_to_Panel(series)
+    assert check_is_mtype(panel, "df-list", scitype="Panel")
+
+
+def test_convert_series_batch_to_panel_axes_differ_from_single():
+    """Test the documented axis difference of batch and single numpy conversion."""
+    arr = np.random.random(size=(10, 2))
+
+    single = convert_Series_to_Panel(arr)
+    batch = convert_Series_batch_to_Panel([arr])
+
+    # single conversion adds an axis at the end, time points stay in the first axis
+    assert single.shape == (10, 2, 1)
+    # batch conversion follows numpy3D (instance, variable, time point) order
+    assert batch.shape == (1, 2, 10)
+    np.testing.assert_array_equal(batch[0].T, single[:, :, 0])
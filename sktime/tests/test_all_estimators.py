@@ -121,6 +121,7 @@ class BaseFixtureGenerator:
             fixture_vars=fixture_vars,
             generator_dict=self.generator_dict(),
             fixture_sequence=fixture_sequence,
+            deepcopy_fixtures=True,
         )
 
         metafunc.parametrize(fixture_param_str, fixture_prod, ids=fixture_names)
@@ -388,6 +389,7 @@ class QuickTester:
                 fixture_vars=fixture_vars,
                 generator_dict=temp_generator_dict,
                 fixture_sequence=fixture_sequence,
+                deepcopy_fixtures=True,
             )
 
             # if function is decorated with mark.parameterize, add variable settings
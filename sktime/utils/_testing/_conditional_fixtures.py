@@ -9,18 +9,23 @@ __author__ = ["fkiraly"]
 __all__ = ["create_conditional_fixtures_and_names"]
 
 from copy import deepcopy
+from inspect import signature
+from itertools import product
 from typing import Callable, Dict, List
 
-import numpy as np
-
 
 class FixtureGenerationError(Exception):
     """Raised when a fixture fails to generate."""
 
     def __init__(self, fixture_name="", err=None):
         self.fixture_name = fixture_name
+        self.err = err
         super().__init__(f"fixture {fixture_name} failed to generate. {err}")
 
+    def __reduce__(self):
+        """Return constructor arguments, used by copy and pickle."""
+        return type(self), (self.fixture_name, self.err)
+
 
 def create_conditional_fixtures_and_names(
     test_name: str,
@@ -28,6 +33,7 @@ def create_conditional_fixtures_and_names(
     generator_dict: Dict[str, Callable],
     fixture_sequence: List[str] = None,
     raise_exceptions: bool = False,
+    deepcopy_fixtures: bool = False,
 ):
     """Create conditional fixtures for pytest_generate_tests.
 
@@ -63,11 +69,20 @@ def create_conditional_fixtures_and_names(
             in fixture_sequence to the left of my_variable
             it should return a list of fixtures for my_variable
             under the assumption that arguments have given values
+        generators with signature (test_name: str) -> fixtures are unconditional,
+            they are called only once, without values of other fixture variables
+            generators that accept **kwargs are always called once per fixture
+            combination to their left, even if they ignore kwargs - to be called
+            only once, a generator must take test_name as its only argument
     fixture_sequence : list of str, optional, default = None
         used in prioritizing conditional generators, sequentially (see above)
     raise_exceptions : bool, optional, default = False
         whether fixture generation errors or other Exceptions are raised
         if False, exceptions are returned instead of fixtures
+    deepcopy_fixtures : bool, optional, default = False
+        whether each tuple in fixture_prod is a deep copy of the generated fixtures
+        if False, fixture objects may be shared between elements of fixture_prod
+        if True, no two elements of fixture_prod share (mutable) fixture objects
 
     Returns
     -------
@@ -151,14 +166,29 @@ def create_conditional_fixtures_and_names(
 
         return fixture_prod, fixture_names
 
+    # names are kept as tuples of per-variable names, and joined once at the end
     fixture_prod = [()]
-    fixture_names = [""]
+    fixture_names = [()]
 
     # we loop over fixture_vars, incrementally going through conditionals
     for i, fixture_var in enumerate(fixture_vars):
         old_fixture_vars = fixture_vars[0:i]
 
-        # then take successive left products
+        # generators that take no arguments except test_name cannot depend on
+        #   fixtures to the left, so they are called once and the product is direct
+        if _takes_only_test_name(generator_dict[fixture_var]):
+            new_fixtures, new_fixture_names_r = get_fixtures(fixture_var)
+            fixture_prod = [
+                fixture + (new_fixture,)
+                for fixture, new_fixture in product(fixture_prod, new_fixtures)
+            ]
+            fixture_names = [
+                fixture_name + (x,)
+                for fixture_name, x in product(fixture_names, new_fixture_names_r)
+            ]
+            continue
+
+        # otherwise, take successive left products, conditional on the fixtures
         new_fixture_prod = []
         new_fixture_names = []
 
@@ -170,24 +200,24 @@ def create_conditional_fixtures_and_names(
             else:
                 kwargs = dict(zip(old_fixture_vars, fixture))
             # retrieve conditional fixtures, conditional on fixture values in kwargs
-            new_fixtures, new_fixture_names_r = deepcopy(
-                get_fixtures(fixture_var, **kwargs)
-            )
+            new_fixtures, new_fixture_names_r = get_fixtures(fixture_var, **kwargs)
             # new fixture values are concatenation/product of old values plus new
             new_fixture_prod += [
-                deepcopy(fixture) + (new_fixture,) for new_fixture in new_fixtures
+                fixture + (new_fixture,) for new_fixture in new_fixtures
             ]
-            # new fixture name is concatenation of name so far and "dash-new name"
-            #   if the new name is empty string, don't add a dash
-            if len(new_fixture_names_r) > 0 and new_fixture_names_r[0] != "":
-                new_fixture_names_r = [f"-{x}" for x in new_fixture_names_r]
-            new_fixture_names += [f"{fixture_name}{x}" for x in new_fixture_names_r]
+            # new fixture name is tuple of names so far plus new name
+            new_fixture_names += [fixture_name + (x,) for x in new_fixture_names_r]
 
         fixture_prod = new_fixture_prod
         fixture_names = new_fixture_names
 
-    # due to the concatenation, fixture names all start leading "-" which is removed
-    fixture_names = [x[1:] for x in fixture_names]
+    # copies are made once per final fixture tuple, not at every step of the product
+    if deepcopy_fixtures:
+        fixture_prod = [deepcopy(x) for x in fixture_prod]
+
+    # fixture names are the names per variable, separated by "-"
+    #   empty names are skipped, so they do not produce a dash
+    fixture_names = ["-".join(filter(None, x)) for x in fixture_names]
 
     # in pytest convention, variable strings are separated by comma
     fixture_param_str = ",".join(fixture_vars)
@@ -215,11 +245,32 @@ def _check_list_of_str(obj, name="obj"):
     ------
     TypeError if obj is not list of str
     """
-    if not isinstance(obj, list) or not np.all(isinstance(x, str) for x in obj):
+    if not isinstance(obj, list) or not all(isinstance(x, str) for x in obj):
         raise TypeError(f"{name} must be a list of str")
     return obj
 
 
+def _takes_only_test_name(generator):
+    """Check whether a fixture generator takes no arguments other than test_name.
+
+    Parameters
+    ----------
+    generator : callable, fixture generator from generator_dict
+
+    Returns
+    -------
+    bool, True if generator has exactly one parameter, and no variable arguments
+        False if the signature of generator cannot be inspected
+    """
+    try:
+        parameters = signature(generator).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return len(parameters) == 1 and all(
+        p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in parameters
+    )
+
+
 def _remove_single(x):
     """Remove tuple wrapping from singleton.
 
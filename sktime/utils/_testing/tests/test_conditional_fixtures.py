@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Tests for create_conditional_fixtures_and_names utility."""
+
+__author__ = ["fkiraly"]
+
+from copy import deepcopy
+
+import pytest
+
+from sktime.utils._testing._conditional_fixtures import (
+    FixtureGenerationError,
+    create_conditional_fixtures_and_names,
+)
+
+
+def _generate_number(test_name, **kwargs):
+    return [1, 2, 3]
+
+
+def _generate_multiples(test_name, number, **kwargs):
+    return [number * i for i in range(1, number + 1)]
+
+
+def _generate_obj(test_name, **kwargs):
+    return [{"a": 42}], ["obj"]
+
+
+def _generate_error(test_name, **kwargs):
+    raise ValueError("no fixtures for you")
+
+
+GENERATOR_DICT = {
+    "number": _generate_number,
+    "multiples": _generate_multiples,
+    "obj": _generate_obj,
+    "error": _generate_error,
+}
+
+
+def test_conditional_fixtures():
+    """Test fixtures and names for conditional generators, as in the docstring."""
+    param_str, fixture_prod, fixture_names = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["number", "multiples"],
+        generator_dict=GENERATOR_DICT,
+    )
+
+    assert param_str == "number,multiples"
+    assert list(fixture_prod) == [(1, 1), (2, 2), (2, 4), (3, 3), (3, 6), (3, 9)]
+    assert list(fixture_names) == ["1-1", "2-2", "2-4", "3-3", "3-6", "3-9"]
+
+
+def test_conditional_fixtures_sequence_and_singleton():
+    """Test fixture_sequence ordering, unknown variables and singleton unwrapping."""
+    param_str, fixture_prod, fixture_names = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["multiples", "number", "not_a_fixture"],
+        generator_dict=GENERATOR_DICT,
+        fixture_sequence=["number", "multiples"],
+    )
+    assert param_str == "number,multiples"
+    assert list(fixture_prod)[:2] == [(1, 1), (2, 2)]
+
+    param_str, fixture_prod, fixture_names = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["number"],
+        generator_dict=GENERATOR_DICT,
+    )
+    assert param_str == "number"
+    # fixtures and names are lists, also for a single variable of scalars
+    assert fixture_prod == [1, 2, 3]
+    assert fixture_names == ["1", "2", "3"]
+
+    # empty names do not add a dash to the fixture name
+    _, _, fixture_names = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["noname", "number"],
+        generator_dict={**GENERATOR_DICT, "noname": lambda x, **y: ([0], [""])},
+    )
+    assert list(fixture_names) == ["1", "2", "3"]
+
+
+def test_conditional_fixtures_unconditional_generator():
+    """Test that generators taking only test_name are called once, not per fixture."""
+    n_calls = []
+
+    def _generate_letter(test_name):
+        n_calls.append(test_name)
+        return ["a", "b"]
+
+    _, fixture_prod, fixture_names = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["number", "multiples", "letter"],
+        generator_dict={**GENERATOR_DICT, "letter": _generate_letter},
+    )
+
+    assert len(n_calls) == 1
+    assert list(fixture_prod)[:3] == [(1, 1, "a"), (1, 1, "b"), (2, 2, "a")]
+    assert list(fixture_names)[:3] == ["1-1-a", "1-1-b", "2-2-a"]
+    assert len(fixture_prod) == len(fixture_names) == 12
+
+
+@pytest.mark.parametrize("deepcopy_fixtures", [True, False])
+def test_conditional_fixtures_deepcopy(deepcopy_fixtures):
+    """Test that fixture objects are shared unless deepcopy_fixtures=True."""
+    _, fixture_prod, _ = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["number", "obj"],
+        generator_dict={"number": _generate_number, "obj": lambda x, **y: [{}]},
+        deepcopy_fixtures=deepcopy_fixtures,
+    )
+    objs = [fixture[1] for fixture in fixture_prod]
+    # the generator is called once per number and returns a new dict each time
+    assert len({id(obj) for obj in objs}) == 3
+
+    _, fixture_prod, _ = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["obj", "number"],
+        generator_dict=GENERATOR_DICT,
+        deepcopy_fixtures=deepcopy_fixtures,
+    )
+    objs = [fixture[0] for fixture in fixture_prod]
+    n_distinct = len({id(obj) for obj in objs})
+    assert n_distinct == (3 if deepcopy_fixtures else 1)
+    assert all(obj == {"a": 42} for obj in objs)
+
+
+def test_conditional_fixtures_errors():
+    """Test that generation errors are returned, or raised if requested."""
+    _, fixture_prod, fixture_names = create_conditional_fixtures_and_names(
+        test_name="test_foo",
+        fixture_vars=["number", "error"],
+        generator_dict=GENERATOR_DICT,
+    )
+    assert len(fixture_prod) == 3
+    assert all(isinstance(x[1], FixtureGenerationError) for x in fixture_prod)
+    assert list(fixture_names) == ["1-Error:error", "2-Error:error", "3-Error:error"]
+
+    with pytest.raises(FixtureGenerationError, match="error"):
+        create_conditional_fixtures_and_names(
+            test_name="test_foo",
+            fixture_vars=["number", "error"],
+            generator_dict=GENERATOR_DICT,
+            raise_exceptions=True,
+        )
+
+
+def test_conditional_fixtures_check_list_of_str():
+    """Test that fixture_vars and fixture_sequence must be lists of str."""
+    with pytest.raises(TypeError, match="fixture_vars"):
+        create_conditional_fixtures_and_names(
+            test_name="test_foo",
+            fixture_vars="number",
+            generator_dict=GENERATOR_DICT,
+        )
+
+    with pytest.raises(TypeError, match="fixture_sequence"):
+        create_conditional_fixtures_and_names(
+            test_name="test_foo",
+            fixture_vars=["number"],
+            generator_dict=GENERATOR_DICT,
+            fixture_sequence=["number", 42],
+        )
+
+
+def test_fixture_generation_error_copy():
+    """Test that FixtureGenerationError keeps its message when deep copied."""
+    error = FixtureGenerationError(fixture_name="foo", err=ValueError("bar"))
+    error_copy = deepcopy(error)
+
+    assert error_copy.fixture_name == "foo"
+    assert str(error_copy) == str(error) == "fixture foo failed to generate. bar"